@@ -17,16 +17,55 @@ Usage in Dynamo Python node:
 
 import clr
 clr.AddReference('ProtoGeometry')
-from Autodesk.DesignScript.Geometry import Point, Line, NurbsCurve, Surface
+from Autodesk.DesignScript.Geometry import Point, Line, NurbsCurve, NurbsSurface, Surface
 
 import math
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import List, Tuple, Optional
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is not available in every Dynamo Python engine
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    from numba import cuda
+    if not cuda.is_available():
+        cuda = None
+except ImportError:
+    cuda = None
+
+# Optional code-generating backend for the reaction-diffusion step. Only
+# looked up here: importing pystencils and sympy takes about half a second,
+# so _pystencils_rd_step imports them on first use
+ps = find_spec("pystencils")
+
 
 # =============================================================================
 # Spiral Generators
 # =============================================================================
 
+# Phyllotaxis divergence angles: the golden angle, or 360 / phi
+_GOLDEN_ANGLE_RAD = math.radians(137.5077640500378)
+_ALT_ANGLE_RAD = math.radians(360 / ((1 + 5 ** 0.5) / 2))
+
+
+def _polar_points(center: Point, r, theta) -> List[Point]:
+    """Build Points from NumPy arrays of polar coordinates around center."""
+    xs = (center.X + r * np.cos(theta)).tolist()
+    ys = (center.Y + r * np.sin(theta)).tolist()
+    z = center.Z
+    return [Point.ByCoordinates(x, y, z) for x, y in zip(xs, ys)]
+
+
 def archimedean_spiral(
     center: Point,
     turns: float = 5,
@@ -48,6 +87,11 @@ def archimedean_spiral(
     points = []
     total_points = int(turns * points_per_turn)
     
+    if np is not None:
+        theta = 2 * np.pi * np.arange(total_points + 1) / points_per_turn
+        r = spacing * theta / (2 * np.pi)
+        return NurbsCurve.ByPoints(_polar_points(center, r, theta))
+    
     for i in range(total_points + 1):
         theta = 2 * math.pi * i / points_per_turn
         r = spacing * theta / (2 * math.pi)
@@ -82,6 +126,11 @@ def logarithmic_spiral(
     points = []
     total_points = int(turns * points_per_turn)
     
+    if np is not None:
+        theta = 2 * np.pi * np.arange(total_points + 1) / points_per_turn
+        r = initial_radius * np.exp(growth_rate * theta)
+        return NurbsCurve.ByPoints(_polar_points(center, r, theta))
+    
     for i in range(total_points + 1):
         theta = 2 * math.pi * i / points_per_turn
         r = initial_radius * math.exp(growth_rate * theta)
@@ -113,6 +162,16 @@ def fermat_spiral(
     """
     result = []
     
+    if np is not None:
+        theta = np.arange(points) * 2 * np.pi / 10
+        r = c * np.sqrt(theta)
+        
+        # Stop at the first point beyond max_radius
+        outside = np.flatnonzero(r > max_radius)
+        if len(outside):
+            theta, r = theta[:outside[0]], r[:outside[0]]
+        return _polar_points(center, r, theta)
+    
     for i in range(points):
         theta = i * 2 * math.pi / 10  # Adjust for point distribution
         r = c * math.sqrt(theta)
@@ -142,16 +201,22 @@ def phyllotaxis_points(
         center: Center point
         count: Number of points
         scale: Scale factor for radius
-        golden_angle: Use golden angle (137.5°) if True
+        golden_angle: Use golden angle (137.5°) if True, otherwise 360° / phi
         
     Returns:
         List of points in phyllotaxis arrangement
     """
     points = []
-    angle_increment = 137.5077640500378 if golden_angle else 360 / math.phi
+    step = _GOLDEN_ANGLE_RAD if golden_angle else _ALT_ANGLE_RAD
+    
+    if np is not None:
+        i = np.arange(count)
+        theta = i * step
+        r = scale * np.sqrt(i)
+        return _polar_points(center, r, theta)
     
     for i in range(count):
-        theta = math.radians(i * angle_increment)
+        theta = i * step
         r = scale * math.sqrt(i)
         
         x = center.X + r * math.cos(theta)
@@ -165,6 +230,67 @@ def phyllotaxis_points(
 # Wave Interference Patterns
 # =============================================================================
 
+def _sample_grid(width: float, height: float, resolution: int) -> Tuple:
+    """Return (X, Y) NumPy sample grids, indexed [i, j] like the loops."""
+    xs = np.linspace(0, width, resolution)
+    ys = np.linspace(0, height, resolution)
+    return np.meshgrid(xs, ys, indexing='ij')
+
+
+def _wave_heights(X, Y, sources, k: float, amplitude: float):
+    """Sum the waves from all sources over a sample grid in one pass."""
+    src = np.asarray(sources, dtype=float).reshape(-1, 2)
+    if njit is not None:
+        return _wave_kernel(
+            X[:, 0].copy(), Y[0].copy(), src[:, 0].copy(), src[:, 1].copy(),
+            float(k), float(amplitude)
+        )
+    sx = src[:, 0, None, None]
+    sy = src[:, 1, None, None]
+    return (amplitude * np.sin(k * np.hypot(X - sx, Y - sy))).sum(axis=0)
+
+
+def _wave_kernel(xs, ys, sx, sy, k, amplitude):
+    """Wave heights on the xs-by-ys grid; rows run in parallel under Numba."""
+    Z = np.zeros((xs.size, ys.size))
+    for i in prange(xs.size):
+        for j in range(ys.size):
+            z = 0.0
+            for s in range(sx.size):
+                dx = xs[i] - sx[s]
+                dy = ys[j] - sy[s]
+                z += amplitude * math.sin(k * math.sqrt(dx * dx + dy * dy))
+            Z[i, j] = z
+    return Z
+
+
+def _moire_kernel(xs, ys, frequency1, frequency2, angle_rad, width):
+    """Moire intensity on the xs-by-ys grid; rows run in parallel under Numba."""
+    Z = np.empty((xs.size, ys.size))
+    w1 = 2 * math.pi * frequency1 / width
+    w2 = 2 * math.pi * frequency2 / width
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    for i in prange(xs.size):
+        for j in range(ys.size):
+            x2 = xs[i] * cos_a - ys[j] * sin_a
+            Z[i, j] = (math.sin(w1 * xs[i]) + math.sin(w2 * x2)) / 2
+    return Z
+
+
+if njit is not None:
+    _wave_kernel = njit(parallel=True, fastmath=True, cache=True)(_wave_kernel)
+    _moire_kernel = njit(parallel=True, fastmath=True, cache=True)(_moire_kernel)
+
+
+def _grid_points(X, Y, Z) -> List[Point]:
+    """Build Points from NumPy grids, row by row."""
+    return [
+        Point.ByCoordinates(x, y, z)
+        for x, y, z in zip(X.ravel().tolist(), Y.ravel().tolist(), Z.ravel().tolist())
+    ]
+
+
 def wave_interference_points(
     width: float = 100,
     height: float = 100,
@@ -194,6 +320,12 @@ def wave_interference_points(
     points = []
     k = 2 * math.pi / wavelength  # Wave number
     
+    if np is not None:
+        X, Y = _sample_grid(width, height, resolution)
+        return _grid_points(X, Y, _wave_heights(X, Y, sources, k, amplitude))
+    
+    sin, hypot = math.sin, math.hypot
+    
     for i in range(resolution):
         for j in range(resolution):
             x = width * i / (resolution - 1)
@@ -202,8 +334,7 @@ def wave_interference_points(
             # Sum contributions from all sources
             z = 0
             for sx, sy in sources:
-                distance = math.sqrt((x - sx)**2 + (y - sy)**2)
-                z += amplitude * math.sin(k * distance)
+                z += amplitude * sin(k * hypot(x - sx, y - sy))
             
             points.append(Point.ByCoordinates(x, y, z))
     
@@ -238,6 +369,16 @@ def wave_interference_surface(
     k = 2 * math.pi / wavelength
     point_grid = []
     
+    if np is not None:
+        X, Y = _sample_grid(width, height, resolution)
+        Z = _wave_heights(X, Y, sources, k, amplitude)
+        point_grid = [
+            _grid_points(x_row, y_row, z_row) for x_row, y_row, z_row in zip(X, Y, Z)
+        ]
+        return NurbsSurface.ByPoints(point_grid)
+    
+    sin, hypot = math.sin, math.hypot
+    
     for i in range(resolution):
         row = []
         for j in range(resolution):
@@ -246,8 +387,7 @@ def wave_interference_surface(
             
             z = 0
             for sx, sy in sources:
-                distance = math.sqrt((x - sx)**2 + (y - sy)**2)
-                z += amplitude * math.sin(k * distance)
+                z += amplitude * sin(k * hypot(x - sx, y - sy))
             
             row.append(Point.ByCoordinates(x, y, z))
         point_grid.append(row)
@@ -280,6 +420,20 @@ def moire_pattern(
     points = []
     angle_rad = math.radians(angle_offset)
     
+    if np is not None:
+        X, Y = _sample_grid(width, height, resolution)
+        if njit is not None:
+            Z = _moire_kernel(
+                X[:, 0].copy(), Y[0].copy(), float(frequency1), float(frequency2),
+                angle_rad, float(width)
+            )
+        else:
+            pattern1 = np.sin(2 * np.pi * frequency1 * X / width)
+            X2 = X * math.cos(angle_rad) - Y * math.sin(angle_rad)
+            pattern2 = np.sin(2 * np.pi * frequency2 * X2 / width)
+            Z = (pattern1 + pattern2) / 2
+        return _grid_points(X, Y, Z * 5)
+    
     for i in range(resolution):
         for j in range(resolution):
             x = width * i / (resolution - 1)
@@ -304,6 +458,206 @@ def moire_pattern(
 # Reaction-Diffusion (Gray-Scott Model)
 # =============================================================================
 
+def _wrap_halo(grid):
+    """Copy opposite edges into the one-cell halo of a padded grid (torus)."""
+    grid[0, 1:-1] = grid[-2, 1:-1]
+    grid[-1, 1:-1] = grid[1, 1:-1]
+    grid[:, 0] = grid[:, -2]
+    grid[:, -1] = grid[:, 1]
+
+
+# Rows per strip in the NumPy step: sized so one strip of every grid the
+# step touches stays in cache across its ufunc passes
+_RD_STRIP_CELLS = 1 << 16
+
+
+def _numpy_rd_step(A, B, newA, newB, lapA, lapB, reaction,
+                   dA, dB, dt, feed_rate, kill_rate):
+    """
+    One Gray-Scott step on halo-padded grids with plain NumPy.
+    
+    NumPy cannot fuse the update into one pass, so the grid is swept in row
+    strips instead: each strip runs every pass of the update while it is
+    still in cache, and the grids are streamed from memory once per step.
+    Every operation writes into preallocated strip-sized scratch (lapA, lapB,
+    reaction), and the operation order follows the scalar update, so the
+    results match it exactly.
+    """
+    _wrap_halo(A)
+    _wrap_halo(B)
+    h = A.shape[0] - 2
+    rows = lapA.shape[0]
+    
+    for r0 in range(1, h + 1, rows):
+        r1 = min(r0 + rows, h + 1)
+        n = r1 - r0
+        lA, lB, r = lapA[:n], lapB[:n], reaction[:n]
+        a, b = A[r0:r1, 1:-1], B[r0:r1, 1:-1]
+        nA, nB = newA[r0:r1, 1:-1], newB[r0:r1, 1:-1]
+        
+        for grid, center, lap in ((A, a, lA), (B, b, lB)):
+            np.add(grid[r0 - 1:r1 - 1, 1:-1], grid[r0 + 1:r1 + 1, 1:-1], out=lap)
+            lap += grid[r0:r1, :-2]
+            lap += grid[r0:r1, 2:]
+            np.multiply(center, 4, out=r)
+            lap -= r
+        
+        np.multiply(a, b, out=r)
+        r *= b
+        
+        # newA = a + dt * (dA * lapA - reaction + feed_rate * (1 - a))
+        lA *= dA
+        lA -= r
+        np.subtract(1, a, out=nA)
+        nA *= feed_rate
+        nA += lA
+        nA *= dt
+        nA += a
+        
+        # newB = b + dt * (dB * lapB + reaction - (kill_rate + feed_rate) * b)
+        lB *= dB
+        lB += r
+        np.multiply(b, kill_rate + feed_rate, out=nB)
+        np.subtract(lB, nB, out=nB)
+        nB *= dt
+        nB += b
+        
+        np.clip(nA, 0, 1, out=nA)
+        np.clip(nB, 0, 1, out=nB)
+
+
+def _rd_step(A, B, newA, newB, dA, dB, dt, feed_rate, kill_rate):
+    """One Gray-Scott step on halo-padded grids, from (A, B) into (newA, newB)."""
+    _wrap_halo(A)
+    _wrap_halo(B)
+    # float32 literals, so Numba does not widen the per-cell math to float64
+    zero, one, four = np.float32(0), np.float32(1), np.float32(4)
+    # Plain row-major sweep: the three rows a cell reads are reused by the
+    # next row while still in cache. Spatial tiling (32x256 blocks) measured
+    # slower here, because the tile bounds stop the inner loop vectorizing.
+    for y in prange(1, A.shape[0] - 1):
+        for x in range(1, A.shape[1] - 1):
+            a = A[y, x]
+            b = B[y, x]
+            lapA = A[y - 1, x] + A[y + 1, x] + A[y, x - 1] + A[y, x + 1] - four * a
+            lapB = B[y - 1, x] + B[y + 1, x] + B[y, x - 1] + B[y, x + 1] - four * b
+            reaction = a * b * b
+            a += dt * (dA * lapA - reaction + feed_rate * (one - a))
+            b += dt * (dB * lapB + reaction - (kill_rate + feed_rate) * b)
+            newA[y, x] = min(one, max(zero, a))
+            newB[y, x] = min(one, max(zero, b))
+
+
+if njit is not None:
+    _wrap_halo = njit(cache=True)(_wrap_halo)
+    _rd_step = njit(parallel=True, fastmath=True, cache=True)(_rd_step)
+
+
+# CUDA thread block shape, and the smallest grid worth moving to the GPU
+_CUDA_BX = 16
+_CUDA_BY = 16
+_CUDA_MIN_CELLS = 256 * 256
+
+
+def _rd_step_cuda(A, B, newA, newB, dA, dB, dt, feed_rate, kill_rate):
+    """One Gray-Scott step on the GPU, one thread per cell (unpadded grids)."""
+    sA = cuda.shared.array((_CUDA_BY + 2, _CUDA_BX + 2), np.float32)
+    sB = cuda.shared.array((_CUDA_BY + 2, _CUDA_BX + 2), np.float32)
+    h, w = A.shape
+    tx, ty = cuda.threadIdx.x, cuda.threadIdx.y
+    x, y = cuda.grid(2)
+    
+    # Stage the block's tile plus a one-cell halo in shared memory, wrapping
+    # around the edges (toroidal); threads past the grid edge load the
+    # wrapped neighbours the last row/column needs
+    gx, gy = x % w, y % h
+    sA[ty + 1, tx + 1] = A[gy, gx]
+    sB[ty + 1, tx + 1] = B[gy, gx]
+    if tx == 0:
+        sA[ty + 1, 0] = A[gy, (x + w - 1) % w]
+        sB[ty + 1, 0] = B[gy, (x + w - 1) % w]
+    if tx == _CUDA_BX - 1:
+        sA[ty + 1, _CUDA_BX + 1] = A[gy, (x + 1) % w]
+        sB[ty + 1, _CUDA_BX + 1] = B[gy, (x + 1) % w]
+    if ty == 0:
+        sA[0, tx + 1] = A[(y + h - 1) % h, gx]
+        sB[0, tx + 1] = B[(y + h - 1) % h, gx]
+    if ty == _CUDA_BY - 1:
+        sA[_CUDA_BY + 1, tx + 1] = A[(y + 1) % h, gx]
+        sB[_CUDA_BY + 1, tx + 1] = B[(y + 1) % h, gx]
+    cuda.syncthreads()
+    
+    if x < w and y < h:
+        zero, one, four = np.float32(0), np.float32(1), np.float32(4)
+        i, j = ty + 1, tx + 1
+        a = sA[i, j]
+        b = sB[i, j]
+        lapA = sA[i - 1, j] + sA[i + 1, j] + sA[i, j - 1] + sA[i, j + 1] - four * a
+        lapB = sB[i - 1, j] + sB[i + 1, j] + sB[i, j - 1] + sB[i, j + 1] - four * b
+        reaction = a * b * b
+        a += dt * (dA * lapA - reaction + feed_rate * (one - a))
+        b += dt * (dB * lapB + reaction - (kill_rate + feed_rate) * b)
+        newA[y, x] = min(one, max(zero, a))
+        newB[y, x] = min(one, max(zero, b))
+
+
+if cuda is not None:
+    _rd_step_cuda = cuda.jit(fastmath=True)(_rd_step_cuda)
+
+
+def _cuda_reaction_diffusion(A, B, iterations, dA, dB, dt, feed_rate, kill_rate):
+    """Run the whole simulation on the GPU, copying back only the final B."""
+    height, width = A.shape
+    threads = (_CUDA_BX, _CUDA_BY)
+    blocks = ((width + _CUDA_BX - 1) // _CUDA_BX, (height + _CUDA_BY - 1) // _CUDA_BY)
+    
+    A, B = cuda.to_device(A), cuda.to_device(B)
+    newA, newB = cuda.device_array_like(A), cuda.device_array_like(B)
+    for _ in range(iterations):
+        _rd_step_cuda[blocks, threads](A, B, newA, newB, dA, dB, dt, feed_rate, kill_rate)
+        A, newA = newA, A
+        B, newB = newB, B
+    return B.copy_to_host()
+
+
+@lru_cache(maxsize=1)
+def _pystencils_rd_step():
+    """
+    Compile the fused Gray-Scott step with pystencils.
+    
+    The generated C kernel reads and writes halo-padded float32 grids like
+    _rd_step, taking keyword arguments A, B, newA, newB, dA, dB, dt, F and k.
+    
+    Returns:
+        Compiled kernel, or None if it cannot be built here
+    """
+    try:
+        import pystencils as ps
+        import sympy as sp
+    except ImportError:
+        return None
+    
+    A, B, newA, newB = ps.fields("A, B, newA, newB: float32[2D]")
+    dA, dB, dt, F, k = sp.symbols("dA dB dt F k")
+    
+    a, b = A.center, B.center
+    lapA = A[1, 0] + A[-1, 0] + A[0, 1] + A[0, -1] - 4 * a
+    lapB = B[1, 0] + B[-1, 0] + B[0, 1] + B[0, -1] - 4 * b
+    reaction = a * b * b
+    
+    update = [
+        ps.Assignment(newA.center, sp.Min(1, sp.Max(0, a + dt * (dA * lapA - reaction + F * (1 - a))))),
+        ps.Assignment(newB.center, sp.Min(1, sp.Max(0, b + dt * (dB * lapB + reaction - (k + F) * b)))),
+    ]
+    
+    try:
+        config = ps.CreateKernelConfig(default_dtype="float32")
+        return ps.create_kernel(update, config).compile()
+    except Exception:
+        # No usable C compiler, or a pystencils release with another API
+        return None
+
+
 def reaction_diffusion(
     width: int = 100,
     height: int = 100,
@@ -317,6 +671,11 @@ def reaction_diffusion(
     
     Creates organic Turing-like patterns.
     
+    Runs on the fastest backend available: a CUDA GPU for large grids, the
+    Numba kernel, a pystencils-generated C kernel when Numba is missing,
+    NumPy, or plain Python loops, in that order. The array backends work in
+    float32.
+    
     Preset parameters for different patterns:
         - Spots: feed=0.037, kill=0.06
         - Stripes: feed=0.055, kill=0.062
@@ -341,58 +700,105 @@ def reaction_diffusion(
     dA, dB = 1.0, 0.5
     dt = 1.0
     
-    # Initialize concentrations
-    A = [[1.0 for _ in range(width)] for _ in range(height)]
-    B = [[0.0 for _ in range(width)] for _ in range(height)]
-    
     # Seed with random spots
+    spots = []
     for _ in range(10):
         cx = random.randint(10, width - 10)
         cy = random.randint(10, height - 10)
-        for dy in range(-3, 4):
-            for dx in range(-3, 4):
-                if 0 <= cy + dy < height and 0 <= cx + dx < width:
-                    B[cy + dy][cx + dx] = 1.0
-    
-    # Laplacian kernel weights
-    def laplacian(grid, x, y):
-        """Calculate discrete Laplacian at a point."""
-        h, w = len(grid), len(grid[0])
-        center = grid[y][x]
+        # 7x7 square around the centre, clipped to the grid
+        spots.append((max(cy - 3, 0), min(cy + 4, height),
+                      max(cx - 3, 0), min(cx + 4, width)))
+    
+    if np is not None:
+        # Concentrations stay in [0, 1], so single precision is plenty and
+        # halves the memory traffic of every step; keep the scalars float32
+        # too so the arithmetic is not promoted back to float64
+        dA, dB, dt = np.float32(dA), np.float32(dB), np.float32(dt)
+        feed_rate, kill_rate = np.float32(feed_rate), np.float32(kill_rate)
+        A = np.ones((height, width), dtype=np.float32)
+        B = np.zeros((height, width), dtype=np.float32)
+        for y0, y1, x0, x1 in spots:
+            B[y0:y1, x0:x1] = 1.0
+        
+        if cuda is not None and width * height >= _CUDA_MIN_CELLS:
+            return _cuda_reaction_diffusion(
+                A, B, iterations, dA, dB, dt, feed_rate, kill_rate
+            ).tolist()
         
-        # Wrap around edges (toroidal)
-        top = grid[(y - 1) % h][x]
-        bottom = grid[(y + 1) % h][x]
-        left = grid[y][(x - 1) % w]
-        right = grid[y][(x + 1) % w]
+        # pystencils only stands in for Numba: at the grid sizes Dynamo runs
+        # it is slower per step and costs far more to build on first call
+        kernel = None
+        if ps is not None and njit is None:
+            kernel = _pystencils_rd_step()
+        if kernel is None and njit is None:
+            # Strip-sized scratch for the NumPy step: two Laplacians and the reaction
+            rows = max(1, min(height, _RD_STRIP_CELLS // max(width, 1)))
+            work = [np.empty((rows, width), dtype=np.float32) for _ in range(3)]
         
-        return top + bottom + left + right - 4 * center
+        # Pad with a one-cell halo so no step has to wrap an index, and
+        # ping-pong between two buffer pairs instead of allocating
+        A = np.pad(A, 1)
+        B = np.pad(B, 1)
+        newA, newB = np.empty_like(A), np.empty_like(B)
+        for _ in range(iterations):
+            if kernel is not None:
+                _wrap_halo(A)
+                _wrap_halo(B)
+                kernel(A=A, B=B, newA=newA, newB=newB,
+                       dA=dA, dB=dB, dt=dt, F=feed_rate, k=kill_rate)
+            elif njit is not None:
+                _rd_step(A, B, newA, newB, dA, dB, dt, feed_rate, kill_rate)
+            else:
+                _numpy_rd_step(A, B, newA, newB, *work,
+                               dA, dB, dt, feed_rate, kill_rate)
+            A, newA = newA, A
+            B, newB = newB, B
+        return B[1:-1, 1:-1].tolist()
+    
+    # Initialize concentrations
+    A = [[1.0 for _ in range(width)] for _ in range(height)]
+    B = [[0.0 for _ in range(width)] for _ in range(height)]
+    
+    for y0, y1, x0, x1 in spots:
+        for row in B[y0:y1]:
+            row[x0:x1] = [1.0] * (x1 - x0)
+    
+    # Every cell is rewritten each step, so two grids can be swapped
+    newA = [[0.0 for _ in range(width)] for _ in range(height)]
+    newB = [[0.0 for _ in range(width)] for _ in range(height)]
+    
+    # Neighbour index tables, wrapping around edges (toroidal)
+    ups = [height - 1] + list(range(height - 1))
+    downs = list(range(1, height)) + [0]
+    columns = list(zip(range(width), [width - 1] + list(range(width - 1)),
+                       list(range(1, width)) + [0]))
     
     # Run simulation
     for _ in range(iterations):
-        # Create new grids for next step
-        newA = [[0.0 for _ in range(width)] for _ in range(height)]
-        newB = [[0.0 for _ in range(width)] for _ in range(height)]
-        
-        for y in range(height):
-            for x in range(width):
-                a = A[y][x]
-                b = B[y][x]
+        for y, up, down in zip(range(height), ups, downs):
+            A_up, A_row, A_down = A[up], A[y], A[down]
+            B_up, B_row, B_down = B[up], B[y], B[down]
+            newA_row, newB_row = newA[y], newB[y]
+            
+            for x, left, right in columns:
+                a = A_row[x]
+                b = B_row[x]
                 
-                lapA = laplacian(A, x, y)
-                lapB = laplacian(B, x, y)
+                # Discrete Laplacian, inlined
+                lapA = A_up[x] + A_down[x] + A_row[left] + A_row[right] - 4 * a
+                lapB = B_up[x] + B_down[x] + B_row[left] + B_row[right] - 4 * b
                 
                 reaction = a * b * b
                 
-                newA[y][x] = a + dt * (dA * lapA - reaction + feed_rate * (1 - a))
-                newB[y][x] = b + dt * (dB * lapB + reaction - (kill_rate + feed_rate) * b)
+                new_a = a + dt * (dA * lapA - reaction + feed_rate * (1 - a))
+                new_b = b + dt * (dB * lapB + reaction - (kill_rate + feed_rate) * b)
                 
                 # Clamp values
-                newA[y][x] = max(0, min(1, newA[y][x]))
-                newB[y][x] = max(0, min(1, newB[y][x]))
+                newA_row[x] = max(0, min(1, new_a))
+                newB_row[x] = max(0, min(1, new_b))
         
-        A = newA
-        B = newB
+        A, newA = newA, A
+        B, newB = newB, B
     
     return B
 
@@ -419,6 +825,17 @@ def reaction_diffusion_to_points(
     height = len(pattern)
     width = len(pattern[0]) if height > 0 else 0
     
+    if np is not None and height > 0:
+        grid = np.asarray(pattern, dtype=float)
+        ys, xs = np.nonzero(grid > threshold)
+        zs = grid[ys, xs] * scale_z
+        return [
+            Point.ByCoordinates(x, y, z)
+            for x, y, z in zip(
+                (xs * scale_xy).tolist(), (ys * scale_xy).tolist(), zs.tolist()
+            )
+        ]
+    
     for y in range(height):
         for x in range(width):
             value = pattern[y][x]
@@ -455,6 +872,17 @@ def reaction_diffusion_to_surface(
     # Sample to reduce point count if needed
     step = max(1, width // 50)
     
+    if np is not None and height > 0:
+        Z = np.asarray(pattern, dtype=float)[::step, ::step] * scale_z
+        X, Y = np.meshgrid(
+            np.arange(0, width, step) * scale_xy,
+            np.arange(0, height, step) * scale_xy
+        )
+        point_grid = [
+            _grid_points(x_row, y_row, z_row) for x_row, y_row, z_row in zip(X, Y, Z)
+        ]
+        return NurbsSurface.ByPoints(point_grid)
+    
     for y in range(0, height, step):
         row = []
         for x in range(0, width, step):
@@ -484,6 +912,7 @@ REACTION_DIFFUSION_PRESETS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_rd_preset(preset_name: str) -> Tuple[float, float]:
     """
     Get reaction-diffusion parameters for a preset pattern.
@@ -20,8 +20,20 @@ clr.AddReference('ProtoGeometry')
 from Autodesk.DesignScript.Geometry import Point, Line, Vector, PolyCurve
 
 import math
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is not available in every Dynamo Python engine
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # =============================================================================
 # L-System Presets
@@ -79,10 +91,11 @@ PRESETS: Dict[str, Dict] = {
     "penrose": {
         "axiom": "[7]++[7]++[7]++[7]++[7]",
         "rules": {
-            "6": "81telefonf]++telefonf]----7telefonf][--8telefonf]",
-            "7": "+81telefonf]--7telefonf]----6telefonf]++6telefonf]++7telefonf]-",
-            "8": "-81telefonf]++7telefonf]++++6telefonf]--6telefonf]--7telefonf]+",
-            "telefonf]": ""
+            "6": "8F++9F----7F[-8F----6F]++",
+            "7": "+8F--9F[---6F--7F]+",
+            "8": "-6F++7F[+++8F++9F]-",
+            "9": "--8F++++6F[+9F++++7F]--7F",
+            "F": ""
         },
         "angle": 36,
         "description": "Penrose tiling pattern"
@@ -108,6 +121,259 @@ PRESETS: Dict[str, Dict] = {
 }
 
 
+# =============================================================================
+# Vectorized Turtle Walk
+# =============================================================================
+
+# Turtle opcodes indexed by command byte; 0 means "no action"
+#   1 draw (F, G)   2 move (f)   3 push ([)   4 pop (])   5 turn around (|)
+#   6 yaw + (+)   7 yaw - (-)   8 pitch down (&)   9 pitch up (^)
+#   10 roll left (\)   11 roll right (/)
+_OPCODES = [0] * 256
+for _op, _symbols in enumerate(('FG', 'f', '[', ']', '|', '+', '-', '&', '^', '\\', '/'), 1):
+    for _symbol in _symbols:
+        _OPCODES[ord(_symbol)] = _op
+del _op, _symbols, _symbol
+
+# Without Numba, interpret_2d only takes the NumPy walk when there is at
+# most one '[' per this many symbols; each bracket costs a Python loop step
+# there, so branchy strings run faster on the scalar turtle
+_NUMPY_SYMBOLS_PER_BRANCH = 100
+
+
+def _command_bytes(commands) -> bytes:
+    """Return a command string as ASCII bytes, passing bytes through as-is."""
+    if isinstance(commands, (bytes, bytearray)):
+        return bytes(commands)
+    return commands.encode('ascii', 'replace')
+
+
+def _walk_2d_numpy(
+    commands: str,
+    x: float,
+    y: float,
+    direction: float,
+    angle: float,
+    length: float,
+    length_decay: float
+) -> Tuple:
+    """
+    Walk a 2D turtle over a command string using NumPy.
+    
+    Headings and positions are prefix sums over the whole string. Each ']'
+    adds a correction that snaps the running sums back to the state saved
+    at its matching '[', so only bracket events need a Python loop.
+    
+    Returns:
+        Tuple of (start_x, start_y, end_x, end_y, sources) arrays, one entry
+        per drawn segment. Segment k ends at point k + 1 (point 0 is the start
+        point); sources gives the point a segment starts from, or -1 if it
+        needs a new one
+    """
+    cmd = np.frombuffer(_command_bytes(commands), dtype=np.uint8)
+    
+    turns = np.zeros(len(cmd))
+    turns[cmd == ord('+')] = -angle
+    turns[cmd == ord('-')] = angle
+    turns[cmd == ord('|')] = 180
+    
+    brackets = np.flatnonzero((cmd == ord('[')) | (cmd == ord(']'))).tolist()
+    is_push = (cmd[brackets] == ord('[')).tolist()
+    
+    # Resolve headings and branch depth at each bracket. The loop reads and
+    # writes plain lists; indexing arrays element by element costs more
+    # than the whole scalar turtle does
+    raw_heading = np.cumsum(turns)
+    heading_at = raw_heading[brackets].tolist()
+    depth_at = [0] * len(brackets)
+    fix_at = [0.0] * len(brackets)
+    stack = []
+    offset = direction
+    for i, push in enumerate(is_push):
+        if push:
+            stack.append(heading_at[i] + offset)
+            depth_at[i] = 1
+        elif stack:
+            new_offset = stack.pop() - heading_at[i]
+            fix_at[i] = new_offset - offset
+            offset = new_offset
+            depth_at[i] = -1
+    
+    heading_fix = np.zeros(len(cmd))
+    depth_step = np.zeros(len(cmd))
+    heading_fix[brackets] = fix_at
+    depth_step[brackets] = depth_at
+    
+    headings = np.radians(raw_heading + np.cumsum(heading_fix) + direction)
+    lengths = length * np.power(length_decay, np.cumsum(depth_step))
+    
+    moves = (cmd == ord('F')) | (cmd == ord('G')) | (cmd == ord('f'))
+    step_x = np.where(moves, lengths * np.cos(headings), 0.0)
+    step_y = np.where(moves, lengths * np.sin(headings), 0.0)
+    
+    # Same correction for positions, now that every step is known
+    raw_x = np.cumsum(step_x)
+    raw_y = np.cumsum(step_y)
+    x_at = raw_x[brackets].tolist()
+    y_at = raw_y[brackets].tolist()
+    fix_x_at = [0.0] * len(brackets)
+    fix_y_at = [0.0] * len(brackets)
+    stack = []
+    off_x, off_y = x, y
+    for i, push in enumerate(is_push):
+        if push:
+            stack.append((x_at[i] + off_x, y_at[i] + off_y))
+        elif stack:
+            sx, sy = stack.pop()
+            new_x, new_y = sx - x_at[i], sy - y_at[i]
+            fix_x_at[i] = new_x - off_x
+            fix_y_at[i] = new_y - off_y
+            off_x, off_y = new_x, new_y
+    
+    fix_x = np.zeros(len(cmd))
+    fix_y = np.zeros(len(cmd))
+    fix_x[brackets] = fix_x_at
+    fix_y[brackets] = fix_y_at
+    
+    pos_x = raw_x + np.cumsum(fix_x) + x
+    pos_y = raw_y + np.cumsum(fix_y) + y
+    
+    draws = (cmd == ord('F')) | (cmd == ord('G'))
+    end_x = pos_x[draws]
+    end_y = pos_y[draws]
+    
+    # A segment continues the previous one unless an 'f' or a pop came between
+    breaks = np.cumsum((cmd == ord('f')) | (depth_step == -1))[draws]
+    joined = breaks == np.concatenate(([0], breaks[:-1]))
+    sources = np.where(joined, np.arange(len(end_x)), -1)
+    
+    return end_x - step_x[draws], end_y - step_y[draws], end_x, end_y, sources
+
+
+def _walk_2d_kernel(cmd, x, y, direction, angle, length, length_decay):
+    """
+    Walk a 2D turtle over a uint8 command array in a single compiled loop.
+    
+    Same result layout as _walk_2d_numpy. Written against plain arrays and
+    scalars only so Numba can compile it; sources also follow pops back to
+    the point saved at the matching '['.
+    """
+    # Pre-pass: count segments and find the deepest bracket nesting, so the
+    # state stack only holds the levels that can be live at once
+    n_draws = 0
+    depth = 0
+    max_depth = 0
+    for c in cmd:
+        if c == 70 or c == 71:      # 'F', 'G'
+            n_draws += 1
+        elif c == 91:               # '['
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif c == 93:               # ']'
+            if depth > 0:
+                depth -= 1
+    
+    start_x = np.empty(n_draws)
+    start_y = np.empty(n_draws)
+    end_x = np.empty(n_draws)
+    end_y = np.empty(n_draws)
+    sources = np.empty(n_draws, np.int64)
+    stack = np.empty((max_depth, 6))
+    
+    # Heading kept as (cos, sin); turns rotate it by the fixed angle
+    rad = math.radians(direction)
+    cos_d = math.cos(rad)
+    sin_d = math.sin(rad)
+    cos_a = math.cos(math.radians(angle))
+    sin_a = math.sin(math.radians(angle))
+    
+    depth = 0
+    k = 0
+    owner = 0
+    current_length = length
+    for c in cmd:
+        if c == 70 or c == 71 or c == 102:     # 'F', 'G', 'f'
+            nx = x + current_length * cos_d
+            ny = y + current_length * sin_d
+            if c == 102:
+                owner = -1
+            else:
+                start_x[k] = x
+                start_y[k] = y
+                end_x[k] = nx
+                end_y[k] = ny
+                sources[k] = owner
+                k += 1
+                owner = k
+            x = nx
+            y = ny
+        elif c == 43:               # '+'
+            cos_d, sin_d = cos_d * cos_a + sin_d * sin_a, sin_d * cos_a - cos_d * sin_a
+        elif c == 45:               # '-'
+            cos_d, sin_d = cos_d * cos_a - sin_d * sin_a, sin_d * cos_a + cos_d * sin_a
+        elif c == 124:              # '|'
+            cos_d = -cos_d
+            sin_d = -sin_d
+        elif c == 91:               # '['
+            stack[depth, 0] = x
+            stack[depth, 1] = y
+            stack[depth, 2] = cos_d
+            stack[depth, 3] = sin_d
+            stack[depth, 4] = current_length
+            stack[depth, 5] = owner
+            depth += 1
+            current_length *= length_decay
+        elif c == 93:               # ']'
+            if depth > 0:
+                depth -= 1
+                x = stack[depth, 0]
+                y = stack[depth, 1]
+                cos_d = stack[depth, 2]
+                sin_d = stack[depth, 3]
+                current_length = stack[depth, 4]
+                owner = int(stack[depth, 5])
+    
+    return start_x, start_y, end_x, end_y, sources
+
+
+if njit is not None:
+    _walk_2d_kernel = njit(cache=True, boundscheck=False)(_walk_2d_kernel)
+
+
+def _frame_rotations(angle_rad: float) -> List:
+    """
+    Build the turtle rotation matrices for one turning angle.
+    
+    The turtle frame is stored as a 3x3 array whose rows are heading, left
+    and up. Turning about one of the turtle's own axes only mixes the other
+    two rows, so each command is a constant matrix applied as R @ frame.
+    
+    Returns:
+        List indexed by turtle opcode (6-11) holding each command's matrix
+    """
+    def yaw(a):
+        c, s = math.cos(a), math.sin(a)
+        return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+    
+    def pitch(a):
+        c, s = math.cos(a), math.sin(a)
+        return np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]])
+    
+    def roll(a):
+        c, s = math.cos(a), math.sin(a)
+        return np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
+    
+    return [None] * 6 + [
+        yaw(-angle_rad),        # '+'
+        yaw(angle_rad),         # '-'
+        pitch(-angle_rad),      # '&'
+        pitch(angle_rad),       # '^'
+        roll(angle_rad),        # '\'
+        roll(-angle_rad),       # '/'
+    ]
+
+
 # =============================================================================
 # L-System Engine
 # =============================================================================
@@ -134,6 +400,31 @@ class LSystem:
         self.axiom = axiom
         self.rules = rules
         self.angle = angle
+
+        # Last (iterations, string) produced, so deeper requests can resume.
+        # None until the first rewrite: generate() hands the work to a shared
+        # engine instance, so only engines ever build the rewrite tables.
+        self._last = None
+    
+    def _prepare_rewrite(self):
+        """Build the rewrite tables on first use."""
+        axiom, rules = self.axiom, self.rules
+
+        # Symbols without a rule are constants and copy straight through
+        self._var_set = frozenset(rules)
+
+        # str.translate is only fast for 1:1 character maps; any longer
+        # replacement makes it slower than the table join below
+        self._trans = None
+        if all(len(k) == 1 and len(v) == 1 for k, v in rules.items()):
+            self._trans = str.maketrans(rules)
+
+        # Every symbol that can appear maps to exactly one part; variables
+        # to their rule, constants to themselves
+        alphabet = set(axiom).union(*rules.values())
+        self._table = {char: rules[char] if char in self._var_set else char for char in alphabet}
+
+        self._last = (0, axiom)
     
     @classmethod
     def from_preset(cls, preset_name: str) -> 'LSystem':
@@ -161,21 +452,47 @@ class LSystem:
         """
         Generate the L-System string after n iterations.
         
+        Results are cached per (axiom, rules, iterations), so re-running
+        a node with unchanged parameters does not rewrite the string again.
+        
         Args:
             iterations: Number of rule applications
             
         Returns:
             The resulting string
         """
-        current = self.axiom
-        
-        for _ in range(iterations):
-            next_string = ""
-            for char in current:
-                # Apply rule if exists, otherwise keep character
-                next_string += self.rules.get(char, char)
-            current = next_string
+        rules_key = tuple(sorted(self.rules.items()))
+        return _generate_cached(self.axiom, rules_key, iterations)
+    
+    def _rewrite(self, iterations: int) -> str:
+        """
+        Apply the production rules, resuming from the last result when possible.
         
+        Production is strictly iterative, so asking for more iterations than
+        last time only applies the missing steps.
+        """
+        if self._last is None:
+            self._prepare_rewrite()
+        iterations = max(0, iterations)
+        done, current = self._last
+        if iterations < done:
+            done, current = 0, self.axiom
+        remaining = iterations - done
+
+        if self._trans is not None:
+            for _ in range(remaining):
+                current = current.translate(self._trans)
+            self._last = (iterations, current)
+            return current
+
+        lookup = self._table.__getitem__
+        for _ in range(remaining):
+            # join measures all parts before copying, so the result is
+            # allocated once at its exact size; map keeps the per-symbol
+            # lookup in C
+            current = "".join(map(lookup, current))
+
+        self._last = (iterations, current)
         return current
     
     def interpret_2d(
@@ -190,7 +507,7 @@ class LSystem:
         Interpret L-System string as 2D turtle graphics.
         
         Args:
-            commands: L-System generated string
+            commands: L-System generated string (str or ASCII bytes)
             start_point: Starting position
             initial_angle: Initial direction (degrees, 90 = up)
             length: Step length
@@ -199,7 +516,6 @@ class LSystem:
         Returns:
             List of Line segments
         """
-        lines = []
         stack = []
         
         x, y = start_point.X, start_point.Y
@@ -207,49 +523,130 @@ class LSystem:
         direction = initial_angle
         current_length = length
         
-        for cmd in commands:
-            if cmd == 'F' or cmd == 'G':
+        # Reuse the previous end point as the next start along a run
+        current_pt = start_point
+        
+        cmd_bytes = _command_bytes(commands)
+        use_arrays = np is not None and (
+            njit is not None
+            or cmd_bytes.count(b'[') * _NUMPY_SYMBOLS_PER_BRANCH <= len(cmd_bytes)
+        )
+        
+        if use_arrays:
+            segments = self._walk_2d(cmd_bytes, x, y, direction, length, length_decay)
+            lines = [None] * len(segments[0])
+            points = [start_point] * (len(lines) + 1)
+            for idx, (sx, sy, ex, ey, src) in enumerate(zip(*(a.tolist() for a in segments))):
+                start = points[src] if src >= 0 else Point.ByCoordinates(sx, sy, z)
+                end = Point.ByCoordinates(ex, ey, z)
+                lines[idx] = Line.ByStartPointEndPoint(start, end)
+                points[idx + 1] = end
+            return lines
+        
+        opcodes = _OPCODES
+        
+        # Every F/G draws exactly one segment, so the result size is known
+        lines = [None] * (cmd_bytes.count(b'F') + cmd_bytes.count(b'G'))
+        idx = 0
+        
+        # Heading kept as (cos, sin); turns rotate it by the fixed angle
+        rad = math.radians(direction)
+        cos_d, sin_d = math.cos(rad), math.sin(rad)
+        cos_a = math.cos(math.radians(self.angle))
+        sin_a = math.sin(math.radians(self.angle))
+        
+        for code in cmd_bytes:
+            op = opcodes[code]
+            if not op:
+                continue
+            
+            if op == 1:
                 # Move forward and draw
-                rad = math.radians(direction)
-                nx = x + current_length * math.cos(rad)
-                ny = y + current_length * math.sin(rad)
+                nx = x + current_length * cos_d
+                ny = y + current_length * sin_d
                 
-                start = Point.ByCoordinates(x, y, z)
+                if current_pt is None:
+                    current_pt = Point.ByCoordinates(x, y, z)
                 end = Point.ByCoordinates(nx, ny, z)
-                lines.append(Line.ByStartPointEndPoint(start, end))
+                lines[idx] = Line.ByStartPointEndPoint(current_pt, end)
+                idx += 1
                 
                 x, y = nx, ny
+                current_pt = end
                 
-            elif cmd == 'f':
-                # Move forward without drawing
-                rad = math.radians(direction)
-                x += current_length * math.cos(rad)
-                y += current_length * math.sin(rad)
-                
-            elif cmd == '+':
+            elif op == 6:
                 # Turn right
-                direction -= self.angle
+                cos_d, sin_d = cos_d * cos_a + sin_d * sin_a, sin_d * cos_a - cos_d * sin_a
                 
-            elif cmd == '-':
+            elif op == 7:
                 # Turn left
-                direction += self.angle
+                cos_d, sin_d = cos_d * cos_a - sin_d * sin_a, sin_d * cos_a + cos_d * sin_a
                 
-            elif cmd == '[':
+            elif op == 2:
+                # Move forward without drawing
+                x += current_length * cos_d
+                y += current_length * sin_d
+                current_pt = None
+                
+            elif op == 3:
                 # Push state onto stack
-                stack.append((x, y, direction, current_length))
+                stack.append((x, y, current_pt, cos_d, sin_d, current_length))
                 current_length *= length_decay
                 
-            elif cmd == ']':
+            elif op == 4:
                 # Pop state from stack
                 if stack:
-                    x, y, direction, current_length = stack.pop()
+                    x, y, current_pt, cos_d, sin_d, current_length = stack.pop()
                     
-            elif cmd == '|':
+            elif op == 5:
                 # Turn around (180 degrees)
-                direction += 180
+                cos_d, sin_d = -cos_d, -sin_d
         
         return lines
     
+    def interpret_2d_arrays(
+        self,
+        commands: str,
+        start_point: Point,
+        initial_angle: float = 90,
+        length: float = 10,
+        length_decay: float = 1.0
+    ) -> Tuple:
+        """
+        Interpret L-System string as 2D turtle graphics, without building geometry.
+        
+        Same walk as interpret_2d, but the segments come back as NumPy arrays
+        so callers can post-process them or create geometry in bulk.
+        
+        Args:
+            commands: L-System generated string (str or ASCII bytes)
+            start_point: Starting position
+            initial_angle: Initial direction (degrees, 90 = up)
+            length: Step length
+            length_decay: Length multiplier when pushing state
+            
+        Returns:
+            Tuple of (starts, ends), each an (N, 3) array of segment endpoints
+        """
+        if np is None:
+            raise ImportError("interpret_2d_arrays requires NumPy")
+        
+        start_x, start_y, end_x, end_y, _ = self._walk_2d(
+            commands, start_point.X, start_point.Y, initial_angle, length, length_decay
+        )
+        z = np.full(len(start_x), float(start_point.Z))
+        return np.column_stack((start_x, start_y, z)), np.column_stack((end_x, end_y, z))
+    
+    def _walk_2d(self, commands, x, y, direction, length, length_decay) -> Tuple:
+        """Run the fastest available array walk (Numba, else NumPy)."""
+        if njit is not None:
+            cmd = np.frombuffer(_command_bytes(commands), dtype=np.uint8)
+            return _walk_2d_kernel(
+                cmd, float(x), float(y), float(direction),
+                float(self.angle), float(length), float(length_decay)
+            )
+        return _walk_2d_numpy(commands, x, y, direction, self.angle, length, length_decay)
+    
     def interpret_3d(
         self,
         commands: str,
@@ -268,7 +665,7 @@ class LSystem:
             / - Roll right
         
         Args:
-            commands: L-System generated string
+            commands: L-System generated string (str or ASCII bytes)
             start_point: Starting position
             initial_direction: Initial direction vector (default: Z-up)
             length: Step length
@@ -280,9 +677,10 @@ class LSystem:
         if initial_direction is None:
             initial_direction = Vector.ByCoordinates(0, 0, 1)
         
-        lines = []
         stack = []
         
+        # Track coordinates as floats; Points are only built for drawn ends
+        px, py, pz = start_point.X, start_point.Y, start_point.Z
         position = start_point
         heading = initial_direction.Normalized()
         left = Vector.ByCoordinates(-1, 0, 0)
@@ -291,64 +689,164 @@ class LSystem:
         
         angle_rad = math.radians(self.angle)
         
-        for cmd in commands:
-            if cmd == 'F' or cmd == 'G':
+        # Cached frame rotations are exact only for an orthonormal frame with
+        # the default's handedness (heading . (left x up) < 0); a downward
+        # heading flips it, and the matrices would then mirror every turn
+        orthonormal = (
+            abs(heading.X * left.X + heading.Y * left.Y + heading.Z * left.Z) < 1e-9 and
+            abs(heading.X * up.X + heading.Y * up.Y + heading.Z * up.Z) < 1e-9
+        )
+        handedness = (
+            heading.X * (left.Y * up.Z - left.Z * up.Y) +
+            heading.Y * (left.Z * up.X - left.X * up.Z) +
+            heading.Z * (left.X * up.Y - left.Y * up.X)
+        )
+        if np is not None and orthonormal and handedness < 0:
+            frame = np.array([
+                [heading.X, heading.Y, heading.Z],
+                [left.X, left.Y, left.Z],
+                [up.X, up.Y, up.Z]
+            ])
+            return self._interpret_3d_frame(
+                commands, start_point, frame, length, length_decay, angle_rad
+            )
+        
+        opcodes = _OPCODES
+        cmd_bytes = _command_bytes(commands)
+        
+        # Every F/G draws exactly one segment, so the result size is known
+        lines = [None] * (cmd_bytes.count(b'F') + cmd_bytes.count(b'G'))
+        idx = 0
+        
+        for code in cmd_bytes:
+            op = opcodes[code]
+            if not op:
+                continue
+            
+            if op == 1:
                 # Move forward and draw
-                new_pos = Point.ByCoordinates(
-                    position.X + heading.X * current_length,
-                    position.Y + heading.Y * current_length,
-                    position.Z + heading.Z * current_length
-                )
-                lines.append(Line.ByStartPointEndPoint(position, new_pos))
+                if position is None:
+                    position = Point.ByCoordinates(px, py, pz)
+                px += heading.X * current_length
+                py += heading.Y * current_length
+                pz += heading.Z * current_length
+                new_pos = Point.ByCoordinates(px, py, pz)
+                lines[idx] = Line.ByStartPointEndPoint(position, new_pos)
+                idx += 1
                 position = new_pos
                 
-            elif cmd == 'f':
+            elif op == 2:
                 # Move forward without drawing
-                position = Point.ByCoordinates(
-                    position.X + heading.X * current_length,
-                    position.Y + heading.Y * current_length,
-                    position.Z + heading.Z * current_length
-                )
+                px += heading.X * current_length
+                py += heading.Y * current_length
+                pz += heading.Z * current_length
+                position = None
                 
-            elif cmd == '+':
+            elif op == 6:
                 # Turn right (yaw)
                 heading = self._rotate_vector(heading, up, -angle_rad)
                 left = self._rotate_vector(left, up, -angle_rad)
                 
-            elif cmd == '-':
+            elif op == 7:
                 # Turn left (yaw)
                 heading = self._rotate_vector(heading, up, angle_rad)
                 left = self._rotate_vector(left, up, angle_rad)
                 
-            elif cmd == '&':
+            elif op == 8:
                 # Pitch down
                 heading = self._rotate_vector(heading, left, -angle_rad)
                 up = self._rotate_vector(up, left, -angle_rad)
                 
-            elif cmd == '^':
+            elif op == 9:
                 # Pitch up
                 heading = self._rotate_vector(heading, left, angle_rad)
                 up = self._rotate_vector(up, left, angle_rad)
                 
-            elif cmd == '\\':
+            elif op == 10:
                 # Roll left
                 left = self._rotate_vector(left, heading, angle_rad)
                 up = self._rotate_vector(up, heading, angle_rad)
                 
-            elif cmd == '/':
+            elif op == 11:
                 # Roll right
                 left = self._rotate_vector(left, heading, -angle_rad)
                 up = self._rotate_vector(up, heading, -angle_rad)
                 
-            elif cmd == '[':
+            elif op == 3:
+                # Push state
+                stack.append((px, py, pz, position, heading, left, up, current_length))
+                current_length *= length_decay
+                
+            elif op == 4:
+                # Pop state
+                if stack:
+                    px, py, pz, position, heading, left, up, current_length = stack.pop()
+        
+        return lines
+    
+    def _interpret_3d_frame(
+        self,
+        commands: str,
+        start_point: Point,
+        frame,
+        length: float,
+        length_decay: float,
+        angle_rad: float
+    ) -> List[Line]:
+        """Run the 3D turtle with the frame held as a NumPy matrix."""
+        stack = []
+        
+        rotations = _frame_rotations(angle_rad)
+        
+        px, py, pz = start_point.X, start_point.Y, start_point.Z
+        hx, hy, hz = frame[0].tolist()
+        position = start_point
+        current_length = length
+        opcodes = _OPCODES
+        cmd_bytes = _command_bytes(commands)
+        
+        lines = [None] * (cmd_bytes.count(b'F') + cmd_bytes.count(b'G'))
+        idx = 0
+        
+        for code in cmd_bytes:
+            op = opcodes[code]
+            if not op:
+                continue
+            
+            if op == 1:
+                # Move forward and draw
+                if position is None:
+                    position = Point.ByCoordinates(px, py, pz)
+                px += hx * current_length
+                py += hy * current_length
+                pz += hz * current_length
+                new_pos = Point.ByCoordinates(px, py, pz)
+                lines[idx] = Line.ByStartPointEndPoint(position, new_pos)
+                idx += 1
+                position = new_pos
+                
+            elif op >= 6:
+                # Yaw, pitch or roll about the turtle's own axes
+                frame = rotations[op] @ frame
+                hx, hy, hz = frame[0].tolist()
+                
+            elif op == 2:
+                # Move forward without drawing
+                px += hx * current_length
+                py += hy * current_length
+                pz += hz * current_length
+                position = None
+                
+            elif op == 3:
                 # Push state
-                stack.append((position, heading, left, up, current_length))
+                stack.append((px, py, pz, position, frame, current_length))
                 current_length *= length_decay
                 
-            elif cmd == ']':
+            elif op == 4:
                 # Pop state
                 if stack:
-                    position, heading, left, up, current_length = stack.pop()
+                    px, py, pz, position, frame, current_length = stack.pop()
+                    hx, hy, hz = frame[0].tolist()
         
         return lines
     
@@ -371,10 +869,51 @@ class LSystem:
         return Vector.ByCoordinates(v_rot_x, v_rot_y, v_rot_z)
 
 
+@lru_cache(maxsize=32)
+def _engine(axiom: str, rules_key: Tuple) -> LSystem:
+    """Shared rewriting engine per rule signature, kept for incremental reuse."""
+    return LSystem(axiom, dict(rules_key))
+
+
+@lru_cache(maxsize=64)
+def _generate_cached(axiom: str, rules_key: Tuple, iterations: int) -> str:
+    """Memoized LSystem.generate, keyed on a hashable rule signature."""
+    return _engine(axiom, rules_key)._rewrite(iterations)
+
+
 # =============================================================================
 # Convenience Functions for Dynamo
 # =============================================================================
 
+@lru_cache(maxsize=32)
+def _parse_custom_rules(custom_rules: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse "F=FF+F,X=FX" into ((symbol, replacement), ...) pairs."""
+    pairs = (rule.strip().split("=") for rule in custom_rules.split(","))
+    return tuple((parts[0].strip(), parts[1].strip()) for parts in pairs if len(parts) == 2)
+
+
+@lru_cache(maxsize=32)
+def _custom_lsystem(axiom: str, rules_key: Tuple, angle: float) -> LSystem:
+    """Shared LSystem instance per custom (axiom, rules, angle)."""
+    return LSystem(axiom, dict(rules_key), angle)
+
+
+def _resolve_lsystem(
+    preset_or_axiom: str,
+    custom_rules: Optional[str],
+    custom_angle: Optional[float]
+) -> LSystem:
+    """Build the LSystem for a preset name or a custom axiom and rule string."""
+    if preset_or_axiom in PRESETS:
+        return LSystem.from_preset(preset_or_axiom)
+    
+    if custom_rules is None:
+        raise ValueError("Custom rules required when not using a preset")
+    
+    angle = custom_angle if custom_angle is not None else 25
+    return _custom_lsystem(preset_or_axiom, _parse_custom_rules(custom_rules), angle)
+
+
 def generate_2d(
     preset_or_axiom: str,
     start_point: Point = None,
@@ -402,23 +941,7 @@ def generate_2d(
     if start_point is None:
         start_point = Point.ByCoordinates(0, 0, 0)
     
-    if preset_or_axiom in PRESETS:
-        # Use preset
-        lsystem = LSystem.from_preset(preset_or_axiom)
-    else:
-        # Custom L-System
-        if custom_rules is None:
-            raise ValueError("Custom rules required when not using a preset")
-        
-        rules = {}
-        for rule in custom_rules.split(","):
-            parts = rule.strip().split("=")
-            if len(parts) == 2:
-                rules[parts[0].strip()] = parts[1].strip()
-        
-        angle = custom_angle if custom_angle is not None else 25
-        lsystem = LSystem(preset_or_axiom, rules, angle)
-    
+    lsystem = _resolve_lsystem(preset_or_axiom, custom_rules, custom_angle)
     commands = lsystem.generate(iterations)
     return lsystem.interpret_2d(commands, start_point, 90, length, length_decay)
 
@@ -450,21 +973,7 @@ def generate_3d(
     if start_point is None:
         start_point = Point.ByCoordinates(0, 0, 0)
     
-    if preset_or_axiom in PRESETS:
-        lsystem = LSystem.from_preset(preset_or_axiom)
-    else:
-        if custom_rules is None:
-            raise ValueError("Custom rules required when not using a preset")
-        
-        rules = {}
-        for rule in custom_rules.split(","):
-            parts = rule.strip().split("=")
-            if len(parts) == 2:
-                rules[parts[0].strip()] = parts[1].strip()
-        
-        angle = custom_angle if custom_angle is not None else 25
-        lsystem = LSystem(preset_or_axiom, rules, angle)
-    
+    lsystem = _resolve_lsystem(preset_or_axiom, custom_rules, custom_angle)
     commands = lsystem.generate(iterations)
     return lsystem.interpret_3d(commands, start_point, None, length, length_decay)
 
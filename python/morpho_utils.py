@@ -13,6 +13,12 @@ from Autodesk.DesignScript.Geometry import Point, Vector, Line
 import math
 from typing import List, Tuple, Optional
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is not available in every Dynamo Python engine
+    np = None
+
 
 def degrees_to_radians(degrees: float) -> float:
     """Convert degrees to radians."""
@@ -67,10 +73,7 @@ def midpoint(p1: Point, p2: Point) -> Point:
 
 def distance(p1: Point, p2: Point) -> float:
     """Calculate distance between two points."""
-    dx = p2.X - p1.X
-    dy = p2.Y - p1.Y
-    dz = p2.Z - p1.Z
-    return math.sqrt(dx*dx + dy*dy + dz*dz)
+    return math.hypot(p2.X - p1.X, p2.Y - p1.Y, p2.Z - p1.Z)
 
 
 def centroid(points: List[Point]) -> Point:
@@ -78,9 +81,12 @@ def centroid(points: List[Point]) -> Point:
     if not points:
         raise ValueError("Cannot calculate centroid of empty list")
     
-    sum_x = sum(p.X for p in points)
-    sum_y = sum(p.Y for p in points)
-    sum_z = sum(p.Z for p in points)
+    # One pass over the points: each attribute read crosses into .NET
+    sum_x = sum_y = sum_z = 0.0
+    for p in points:
+        sum_x += p.X
+        sum_y += p.Y
+        sum_z += p.Z
     n = len(points)
     
     return Point.ByCoordinates(sum_x / n, sum_y / n, sum_z / n)
@@ -100,9 +106,20 @@ def regular_polygon_points(center: Point, radius: float, sides: int, rotation: f
         List of vertex points
     """
     points = []
-    for i in range(sides):
-        angle = (2 * math.pi * i / sides) + rotation - math.pi / 2
-        points.append(point_at_angle(center, angle, radius))
+    if sides <= 0:
+        return points
+    
+    # The vertex angles step evenly, so rotate (cos, sin) by a fixed
+    # increment instead of evaluating both per vertex
+    step = 2 * math.pi / sides
+    cos_d, sin_d = math.cos(step), math.sin(step)
+    start = rotation - math.pi / 2
+    c, s = math.cos(start), math.sin(start)
+    cx, cy, cz = center.X, center.Y, center.Z
+    
+    for _ in range(sides):
+        points.append(Point.ByCoordinates(cx + radius * c, cy + radius * s, cz))
+        c, s = c * cos_d - s * sin_d, s * cos_d + c * sin_d
     return points
 
 
@@ -185,22 +202,86 @@ def scale_point(point: Point, center: Point, scale: float) -> Point:
     )
 
 
+def points_to_array(points: List[Point]):
+    """
+    Read a list of points into an (N, 3) NumPy array in one pass.
+    
+    Every X/Y/Z read crosses into .NET, so bulk callers should convert once
+    with this and then use the *_many helpers instead of per-point calls.
+    
+    Args:
+        points: Points to read
+        
+    Returns:
+        (N, 3) float array of coordinates
+    """
+    if np is None:
+        raise ImportError("points_to_array requires NumPy")
+    return np.array([(p.X, p.Y, p.Z) for p in points], dtype=float).reshape(-1, 3)
+
+
+def array_to_points(coords) -> List[Point]:
+    """Build Points from an (N, 3) coordinate array."""
+    if np is None:
+        raise ImportError("array_to_points requires NumPy")
+    return [Point.ByCoordinates(x, y, z) for x, y, z in np.asarray(coords).tolist()]
+
+
+def distance_many(a, b):
+    """
+    Distances between matching rows of two coordinate arrays.
+    
+    Args:
+        a: (N, 3) array of start coordinates
+        b: (N, 3) array of end coordinates, or a single (3,) point
+        
+    Returns:
+        (N,) array of distances
+    """
+    if np is None:
+        raise ImportError("distance_many requires NumPy")
+    d = np.asarray(b, dtype=float) - np.asarray(a, dtype=float)
+    return np.sqrt((d * d).sum(axis=-1))
+
+
+def lerp_many(a, b, t):
+    """
+    Linear interpolation between matching rows of two coordinate arrays.
+    
+    Args:
+        a: (N, 3) array of start coordinates
+        b: (N, 3) array of end coordinates
+        t: Interpolation factor, a scalar or an (N,) array
+        
+    Returns:
+        (N, 3) array of interpolated coordinates
+    """
+    if np is None:
+        raise ImportError("lerp_many requires NumPy")
+    a = np.asarray(a, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if t.ndim:
+        t = t[..., None]
+    return a + (np.asarray(b, dtype=float) - a) * t
+
+
+_PHI = (1 + math.sqrt(5)) / 2
+
+
 def golden_ratio() -> float:
     """Return the golden ratio (phi)."""
-    return (1 + math.sqrt(5)) / 2
+    return _PHI
 
 
 def fibonacci_sequence(n: int) -> List[int]:
     """Generate first n Fibonacci numbers."""
     if n <= 0:
         return []
-    if n == 1:
-        return [0]
-    if n == 2:
-        return [0, 1]
-    
-    seq = [0, 1]
-    for i in range(2, n):
-        seq.append(seq[-1] + seq[-2])
+    
+    seq = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        seq[i] = a
+        a, b = b, a + b
     return seq
 
@@ -0,0 +1,83 @@
+"""
+Test setup for the Morpho Python scripts.
+
+The scripts import Dynamo's ProtoGeometry through pythonnet (clr), which
+only exists inside Dynamo. Register minimal stand-ins for the geometry
+types they use so the pure-Python logic can be exercised with pytest.
+"""
+
+import math
+import os
+import sys
+import types
+
+
+class Point:
+    def __init__(self, x, y, z=0.0):
+        self.X, self.Y, self.Z = float(x), float(y), float(z)
+
+    @classmethod
+    def ByCoordinates(cls, x, y, z=0.0):
+        return cls(x, y, z)
+
+
+class Vector(Point):
+    def Normalized(self):
+        n = math.sqrt(self.X ** 2 + self.Y ** 2 + self.Z ** 2)
+        return Vector(self.X / n, self.Y / n, self.Z / n)
+
+
+class Line:
+    def __init__(self, start, end):
+        self.StartPoint, self.EndPoint = start, end
+
+    @classmethod
+    def ByStartPointEndPoint(cls, start, end):
+        return cls(start, end)
+
+
+class _ByPoints:
+    @classmethod
+    def ByPoints(cls, points):
+        obj = cls()
+        obj.points = points
+        return obj
+
+
+class PolyCurve(_ByPoints):
+    pass
+
+
+class NurbsCurve(_ByPoints):
+    pass
+
+
+class NurbsSurface(_ByPoints):
+    pass
+
+
+class Surface:
+    pass
+
+
+def _install_geometry_stubs():
+    clr = types.ModuleType("clr")
+    clr.AddReference = lambda name: None
+
+    geometry = types.ModuleType("Autodesk.DesignScript.Geometry")
+    for cls in (Point, Vector, Line, PolyCurve, NurbsCurve, NurbsSurface, Surface):
+        setattr(geometry, cls.__name__, cls)
+
+    autodesk = types.ModuleType("Autodesk")
+    design_script = types.ModuleType("Autodesk.DesignScript")
+    autodesk.DesignScript = design_script
+    design_script.Geometry = geometry
+
+    sys.modules.setdefault("clr", clr)
+    sys.modules.setdefault("Autodesk", autodesk)
+    sys.modules.setdefault("Autodesk.DesignScript", design_script)
+    sys.modules.setdefault("Autodesk.DesignScript.Geometry", geometry)
+
+
+_install_geometry_stubs()
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python"))
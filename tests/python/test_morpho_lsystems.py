@@ -0,0 +1,73 @@
+import pytest
+
+import morpho_lsystems
+from morpho_lsystems import LSystem, Point, Vector
+
+
+def _end_points(lines):
+    return [(l.EndPoint.X, l.EndPoint.Y, l.EndPoint.Z) for l in lines]
+
+
+def _interpret_3d(commands, direction):
+    lsystem = LSystem("F", {}, angle=90)
+    return _end_points(lsystem.interpret_3d(
+        commands, Point.ByCoordinates(0, 0, 0), Vector.ByCoordinates(*direction), 10, 1
+    ))
+
+
+@pytest.mark.parametrize("commands, expected", [
+    ("F+F", (10, 0, -10)),
+    ("F&F", (0, 10, -10)),
+])
+def test_interpret_3d_downward_heading_turns(commands, expected):
+    assert _interpret_3d(commands, (0, 0, -1))[-1] == pytest.approx(expected, abs=1e-9)
+
+
+@pytest.mark.parametrize("direction", [(0, 0, 1), (0, 0, -1)])
+def test_interpret_3d_frame_path_matches_rotation_fallback(monkeypatch, direction):
+    commands = "F[+F&F]\\F^F/F-F[&&F]F"
+    fast = _interpret_3d(commands, direction)
+    monkeypatch.setattr(morpho_lsystems, "np", None)
+    slow = _interpret_3d(commands, direction)
+    assert len(fast) == len(slow)
+    for p, q in zip(fast, slow):
+        assert p == pytest.approx(q, abs=1e-9)
+
+
+@pytest.mark.parametrize("commands", [
+    "F[+F[-F]F]F[[F]]-F",
+    "]]F[+F]]F[[-F",
+    "[F]" * 500 + "F",
+])
+def test_walk_2d_kernel_matches_numpy_walk(commands):
+    np = pytest.importorskip("numpy")
+    cmd = np.frombuffer(commands.encode("ascii"), dtype=np.uint8)
+    kernel = morpho_lsystems._walk_2d_kernel(cmd, 0.0, 0.0, 90.0, 25.0, 10.0, 0.7)
+    walk = morpho_lsystems._walk_2d_numpy(commands, 0.0, 0.0, 90.0, 25.0, 10.0, 0.7)
+    for a, b in zip(kernel[:4], walk[:4]):
+        assert a.tolist() == pytest.approx(b.tolist(), abs=1e-9)
+
+
+def test_generate_leaves_rewrite_tables_to_the_shared_engine():
+    lsystem = LSystem.from_preset("tree")
+    result = lsystem.generate(3)
+    assert lsystem._last is None
+    assert not hasattr(lsystem, "_trans")
+
+    # The engine rewrites like the naive per-symbol expansion
+    expected = lsystem.axiom
+    for _ in range(3):
+        expected = "".join(lsystem.rules.get(c, c) for c in expected)
+    assert result == expected
+    assert LSystem(lsystem.axiom, lsystem.rules)._rewrite(3) == expected
+
+
+def test_penrose_preset_has_balanced_brackets():
+    commands = LSystem.from_preset("penrose").generate(3)
+    assert "telefonf" not in commands
+
+    depth = 0
+    for symbol in commands:
+        depth += {"[": 1, "]": -1}.get(symbol, 0)
+        assert depth >= 0
+    assert depth == 0
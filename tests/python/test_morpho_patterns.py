@@ -0,0 +1,31 @@
+import pytest
+
+import morpho_patterns
+
+
+def test_reaction_diffusion_prefers_numba_over_pystencils(monkeypatch):
+    if morpho_patterns.np is None or morpho_patterns.njit is None:
+        pytest.skip("needs NumPy and Numba")
+
+    def fail():
+        raise AssertionError("pystencils backend built while Numba is available")
+
+    monkeypatch.setattr(morpho_patterns, "ps", object())
+    monkeypatch.setattr(morpho_patterns, "_pystencils_rd_step", fail)
+    pattern = morpho_patterns.reaction_diffusion(24, 24, 5)
+    assert len(pattern) == 24 and len(pattern[0]) == 24
+
+
+def test_phyllotaxis_points_without_golden_angle():
+    center = morpho_patterns.Point.ByCoordinates(0, 0, 0)
+    points = morpho_patterns.phyllotaxis_points(center, 50, 2, golden_angle=False)
+    assert len(points) == 50
+
+
+def test_surface_builders_return_nurbs_surfaces():
+    wave = morpho_patterns.wave_interference_surface(resolution=4)
+    assert isinstance(wave, morpho_patterns.NurbsSurface)
+
+    pattern = [[0.1 * (i + j) for j in range(4)] for i in range(4)]
+    surface = morpho_patterns.reaction_diffusion_to_surface(pattern)
+    assert isinstance(surface, morpho_patterns.NurbsSurface)